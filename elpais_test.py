@@ -1,13 +1,19 @@
+import asyncio
 import json
 import os
 import re
-import time
+import threading
+import httpx
 import requests
 import urllib.parse
 import logging
+import xml.etree.ElementTree as ET
 
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from dotenv import load_dotenv
 from deep_translator import GoogleTranslator
@@ -41,16 +47,101 @@ logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(threadName)s] - %(levelname)s - %(message)s"
 )
+# httpx logs every request at INFO; keep the console to our own messages.
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 REQUESTS_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; bot/0.1)"}
 OPINION_URL      = "https://elpais.com/opinion/"
+OPINION_RSS      = "https://feeds.elpais.com/mrss-s/pages/ep/site/elpais.com/section/opinion/portada"
 DATE_PATTERN     = re.compile(r'/opinion/\d{4}-\d{2}-\d{2}/')
+# href of an <a> tag (not data-href / <link>), absolute, protocol-relative
+# or rooted, pointing at a dated opinion article.
+HREF_DATE_RE     = re.compile(
+    r'<a\s(?:[^>]*?\s)?href\s*=\s*(["\'])'
+    r'((?:(?:https?:)?//[^/"\'\s>]+)?[^"\'#?\s>]*?/opinion/\d{4}-\d{2}-\d{2}/[^"\'#?\s>]*)',
+    re.IGNORECASE,
+)
+# Letter runs (accented letters included), keeping in-word apostrophes.
+WORD_RE          = re.compile(r"[^\W\d_]+(?:['’][^\W\d_]+)*")
 STOPWORDS = {
     "the", "a", "an", "in", "on", "of", "and", "to", "for",
     "is", "it", "its", "at", "by", "or", "that", "this",
     "with", "from", "as", "are", "be", "was", "but", "not"
 }
 
+# An ASCII title is treated as already English (and not translated) only on
+# positive evidence: at least MIN_ENGLISH_HINTS English stopwords ("a" is
+# excluded since Spanish uses it too) and no Spanish function words.
+ENGLISH_HINTS = STOPWORDS - {"a"}
+MIN_ENGLISH_HINTS = 2
+SPANISH_STOPWORD_HINTS = {
+    "el", "la", "los", "las", "de", "del", "y", "en", "que", "un", "una",
+    "unos", "unas", "por", "para", "con", "sin", "no", "ni", "se", "es",
+    "son", "al", "lo", "le", "les", "su", "sus", "como", "pero", "muy",
+    "ya", "hay", "entre", "sobre", "hacia", "desde", "contra", "tras",
+}
+TRANSLATION_CACHE_SIZE = 256
+
+# Cookies the El País consent manager sets once the banner is accepted.
+CONSENT_COOKIE_NAMES = ("euconsent-v2", "didomi_token")
+
+# Selectors tried in order by the soup-based extractors.
+OG_TITLE_SELECTORS = ("meta[property='og:title']", "meta[name='twitter:title']")
+OG_IMAGE_SELECTORS = ("meta[property='og:image']", "meta[name='twitter:image']")
+
+# Only the tags the article extractors read are built into the soup.
+ARTICLE_STRAINER = SoupStrainer(["meta", "article"])
+
+# Streaming: read bodies in 64 KB chunks; article fetches may stop early
+# once this much is buffered and </article> has been seen.
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_MIN_BYTES  = 200 * 1024
+
+# Scroll to the bottom twice (letting lazy content load) then settle mid-page,
+# all inside a single WebDriver command.
+SCROLL_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const bottom = () => window.scrollTo(0, document.body.scrollHeight);
+bottom();
+setTimeout(() => {
+    bottom();
+    setTimeout(() => {
+        window.scrollTo(0, document.body.scrollHeight / 2);
+        done();
+    }, 800);
+}, 800);
+"""
+SCROLL_SCRIPT_TIMEOUT = 5
+
+# BrowserStack timeouts (seconds): per navigation inside a session, and how
+# long run_parallel_browserstack waits for all sessions before returning.
+BS_PAGE_LOAD_TIMEOUT = 60
+BS_RUN_TIMEOUT       = 600
+
+# We only read the DOM. Chromium has a content setting for images only
+# (2 = block); local sessions also block stylesheets and fonts over CDP.
+BLOCKED_CONTENT_PREFS = {"profile.managed_default_content_settings.images": 2}
+# Trailing * so cache-busted assets (app.css?v=123) match too.
+BLOCKED_URL_PATTERNS  = ["*.css*", "*.woff*", "*.ttf*", "*.otf*"]
+
+# Retry policy shared by the requests Session and the httpx page fetches.
+RETRY_TOTAL    = 2
+RETRY_BACKOFF  = 0.3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Shared HTTP session for image downloads: pooled keep-alive connections
+# avoid a fresh TCP + TLS handshake per request.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF,
+                      status_forcelist=list(RETRY_STATUSES)),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+SESSION.headers.update(REQUESTS_HEADERS)
+
 
 # *****************************************************
 # BROWSER FACTORY 
@@ -71,7 +162,9 @@ class BrowserFactory:
         options = ChromeOptions()
         options.add_argument("--headless=new")
         options.add_argument("--start-maximized")
-        return webdriver.Chrome(options=options)
+        options.add_experimental_option("prefs", BLOCKED_CONTENT_PREFS)
+        options.page_load_strategy = "eager"
+        return BrowserFactory._block_css_and_fonts(webdriver.Chrome(options=options))
 
     @staticmethod
     def _create_edge():
@@ -80,7 +173,18 @@ class BrowserFactory:
         options.use_chromium = True
         options.add_argument("--headless=new")
         options.add_argument("--start-maximized")
-        return webdriver.Edge(options=options)
+        options.add_experimental_option("prefs", BLOCKED_CONTENT_PREFS)
+        options.page_load_strategy = "eager"
+        return BrowserFactory._block_css_and_fonts(webdriver.Edge(options=options))
+
+    @staticmethod
+    def _block_css_and_fonts(driver):
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            logging.warning("Could not block stylesheets/fonts: %s", e)
+        return driver
 
     @staticmethod
     def create_browserstack(capability):
@@ -112,7 +216,11 @@ class BrowserFactory:
             options = webdriver.SafariOptions()
         else:
             options = ChromeOptions()
+            options.add_experimental_option("prefs", BLOCKED_CONTENT_PREFS)
 
+        # Return from driver.get at DOMContentLoaded; the explicit waits on
+        # <article>/<a> cover anything that arrives later.
+        options.page_load_strategy = "eager"
         options.set_capability("browserName", browser_name)
 
         if capability.get("browserVersion"):
@@ -133,103 +241,311 @@ class BrowserFactory:
 # SCRAPING UTILITIES 
 # *****************************************************
 
+def looks_english(text):
+    if not text.isascii() or not any(c.isalpha() for c in text):
+        return False
+    words = set(WORD_RE.findall(text.lower()))
+    if SPANISH_STOPWORD_HINTS.intersection(words):
+        return False
+    return len(ENGLISH_HINTS.intersection(words)) >= MIN_ENGLISH_HINTS
+
+
+_translators = threading.local()
+
+
+def get_translator(source="auto", target="en"):
+    """
+    Reuse one GoogleTranslator per language pair *per thread*: translate()
+    stores the text in instance state before sending, so parallel sessions
+    must not share an instance.
+    """
+    cache = getattr(_translators, "by_pair", None)
+    if cache is None:
+        cache = _translators.by_pair = {}
+    key = (source, target)
+    if key not in cache:
+        cache[key] = GoogleTranslator(source=source, target=target)
+    return cache[key]
+
+
+_translation_cache = {}
+_translation_cache_lock = threading.Lock()
+
+
+def _cached_translation(text, source, target):
+    with _translation_cache_lock:
+        return _translation_cache.get((text, source, target))
+
+
+def _store_translation(text, source, target, translated):
+    with _translation_cache_lock:
+        if len(_translation_cache) >= TRANSLATION_CACHE_SIZE:
+            _translation_cache.pop(next(iter(_translation_cache)))
+        _translation_cache[(text, source, target)] = translated
+
+
 def translate_text(text, source="auto", target="en"):
     if not text:
         return ""
+    if target == "en" and looks_english(text):
+        return text
+    cached = _cached_translation(text, source, target)
+    if cached:
+        return cached
     try:
-        translated = GoogleTranslator(source=source, target=target).translate(text)
+        translated = get_translator(source, target).translate(text)
+        if translated:
+            _store_translation(text, source, target, translated)
         return translated if translated else text
     except Exception as e:
-        logging.warning(f"Translation failed: {e}")
+        logging.warning("Translation failed: %s", e)
         return text
 
 
+def translate_titles(titles):
+    """
+    Translate titles, reusing cached results (parallel sessions see the same
+    articles) and sending only the misses through this thread's translator.
+    deep-translator's translate_batch still issues one request per title.
+    """
+    translated, misses = {}, []
+    for t in titles:
+        if not t or t in translated or t in misses:
+            continue
+        if looks_english(t):
+            translated[t] = t
+        else:
+            cached = _cached_translation(t, "auto", "en")
+            if cached:
+                translated[t] = cached
+            else:
+                misses.append(t)
+    if misses:
+        try:
+            for t, result in zip(misses, get_translator().translate_batch(misses)):
+                if result:
+                    _store_translation(t, "auto", "en", result)
+                translated[t] = result or t
+        except Exception as e:
+            logging.warning(f"Batch translation failed, translating one by one: {e}")
+            for t in misses:
+                translated[t] = translate_text(t)
+    return [translated.get(t, t) if t else "" for t in titles]
+
+
 def download_image(url, filename):
     try:
-        r = requests.get(url, stream=True, timeout=12, headers=REQUESTS_HEADERS)
+        r = SESSION.get(url, stream=True, timeout=12)
         r.raise_for_status()
         with open(filename, "wb") as f:
-            for chunk in r.iter_content(1024):
+            for chunk in r.iter_content(STREAM_CHUNK_SIZE):
                 f.write(chunk)
-        logging.info(f"Image saved: {filename}")
+        logging.info("Image saved: %s", filename)
     except Exception as e:
-        logging.warning(f"Failed to download {url}: {e}")
+        logging.warning("Failed to download %s: %s", url, e)
 
 
 def accept_cookies(driver):
+    """Click the consent banner if present; return True once it was accepted."""
     try:
         btn = WebDriverWait(driver, 5).until(
             EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Aceptar')]"))
         )
         btn.click()
         logging.info("Cookie banner accepted.")
+        return True
     except Exception:
         logging.info("No cookie banner found.")
+        return False
+
+
+def has_consent_cookie(driver):
+    return any(driver.get_cookie(name) for name in CONSENT_COOKIE_NAMES)
+
+
+def share_driver_cookies(driver, jar):
+    """Copy the browser's (consent) cookies into a run's httpx cookie jar."""
+    for cookie in driver.get_cookies():
+        jar.set(
+            cookie["name"], cookie["value"],
+            domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+        )
+
 
+def scroll_page(driver):
+    """Trigger lazy loading with one async script instead of several round-trips."""
+    driver.set_script_timeout(SCROLL_SCRIPT_TIMEOUT)
+    driver.execute_async_script(SCROLL_SCRIPT)
 
-def fetch_static_html(url):
+
+async def fetch(client, url, stop_after_article=False):
+    """
+    Stream a page body and decode it once at the end.
+
+    With stop_after_article the download stops as soon as at least
+    STREAM_MIN_BYTES have arrived and the closing </article> tag has been
+    seen — everything we extract lives before that point. Responses with a
+    RETRY_STATUSES code are retried like the requests Session's Retry policy.
+    """
     try:
-        r = requests.get(url, headers=REQUESTS_HEADERS, timeout=10)
-        r.raise_for_status()
-        return r.text
+        for attempt in range(RETRY_TOTAL + 1):
+            async with client.stream("GET", url) as r:
+                retry = r.status_code in RETRY_STATUSES and attempt < RETRY_TOTAL
+                if not retry:
+                    r.raise_for_status()
+                    buf = bytearray()
+                    seen_end = False
+                    async for chunk in r.aiter_bytes(STREAM_CHUNK_SIZE):
+                        buf += chunk
+                        # Overlap by the tag length so a tag split across chunks counts.
+                        if stop_after_article and not seen_end:
+                            seen_end = b"</article>" in buf[-(len(chunk) + 10):]
+                        if seen_end and len(buf) >= STREAM_MIN_BYTES:
+                            break
+                    return buf.decode(r.encoding or "utf-8", errors="replace")
+            # Back off only after the response above has been closed.
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
     except Exception as e:
-        logging.warning(f"requests fetch failed for {url}: {e}")
+        logging.warning("httpx fetch failed for %s: %s", url, e)
         return None
 
 
-def extract_article_urls_from_soup(soup, max_urls=5):
+async def fetch_all(urls, stop_after_article=False, cookies=None):
+    """Fetch every URL concurrently over one multiplexed HTTP/2 connection."""
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=RETRY_TOTAL,  # connection errors only; statuses handled in fetch()
+        limits=httpx.Limits(max_connections=10),
+    )
+    async with httpx.AsyncClient(
+        transport=transport,
+        timeout=10,
+        headers=REQUESTS_HEADERS,
+        cookies=cookies,
+        follow_redirects=True,
+    ) as client:
+        return await asyncio.gather(
+            *(fetch(client, url, stop_after_article) for url in urls)
+        )
+
+
+def fetch_static_html(url, stop_after_article=False, cookies=None):
+    return asyncio.run(fetch_all([url], stop_after_article, cookies))[0]
+
+
+def fetch_article_urls_from_rss(max_urls=5):
+    """Read the opinion RSS feed — a small XML doc instead of the full index page."""
+    try:
+        r = SESSION.get(OPINION_RSS, timeout=10)
+        r.raise_for_status()
+        root = ET.fromstring(r.content)
+    except Exception as e:
+        logging.warning(f"RSS fetch failed for {OPINION_RSS}: {e}")
+        return []
+    urls, seen = [], set()
+    for link in root.iterfind("./channel/item/link"):
+        url = (link.text or "").strip().split("?", 1)[0].split("#", 1)[0]
+        if DATE_PATTERN.search(url) and url not in seen:
+            urls.append(url)
+            seen.add(url)
+            if len(urls) >= max_urls:
+                break
+    return urls
+
+
+def extract_article_urls_from_html(html, max_urls=5):
+    """Scan raw HTML for dated opinion links; BeautifulSoup if the scan comes up short."""
+    urls, seen = [], set()
+    for m in HREF_DATE_RE.finditer(html):
+        url = urllib.parse.urljoin(OPINION_URL, m.group(2))
+        if url not in seen:
+            urls.append(url)
+            seen.add(url)
+            if len(urls) >= max_urls:
+                return urls
+    soup_urls = extract_article_urls_from_soup(BeautifulSoup(html, "html.parser"), max_urls)
+    return soup_urls if len(soup_urls) > len(urls) else urls
+
+
+def extract_article_urls_from_soup(soup, max_urls=5, _date_search=DATE_PATTERN.search):
     urls, seen = [], set()
     for a in soup.find_all("a", href=True):
         href = a["href"]
-        full = href if href.startswith("http") else urllib.parse.urljoin(OPINION_URL, href)
-        if DATE_PATTERN.search(full) and full not in seen:
-            normalized = urllib.parse.urljoin(full, urllib.parse.urlparse(full).path)
-            if normalized not in seen:
-                urls.append(normalized)
-                seen.add(normalized)
-                if len(urls) >= max_urls:
-                    return urls
+        # The date pattern is specific enough to reject most anchors before
+        # paying for any URL normalization.
+        if not _date_search(href):
+            continue
+        if not href.startswith("http"):
+            href = urllib.parse.urljoin(OPINION_URL, href)
+        normalized = href.split("?", 1)[0].split("#", 1)[0]
+        if normalized not in seen:
+            urls.append(normalized)
+            seen.add(normalized)
+            if len(urls) >= max_urls:
+                return urls
     return urls
 
 
-def extract_title_from_article_html(html):
-    if not html:
-        return ""
-    soup = BeautifulSoup(html, "html.parser")
-    meta = soup.select_one("meta[property='og:title']")
-    return meta.get("content", "").strip() if meta else ""
+def _first_meta_content(soup, selectors):
+    for selector in selectors:
+        meta = soup.select_one(selector)
+        if meta and meta.get("content"):
+            return meta["content"].strip()
+    return None
 
 
-def extract_article_content(html, max_chars=500):
-    if not html:
-        return ""
-    soup = BeautifulSoup(html, "html.parser")
+def extract_title(soup):
+    return _first_meta_content(soup, OG_TITLE_SELECTORS) or ""
+
+
+def extract_article_content(soup, max_chars=500):
     article = soup.find("article")
     if not article:
         return ""
-    paragraphs = article.find_all("p")
-    text = " ".join(p.get_text(separator=" ", strip=True) for p in paragraphs)
-    return text[:max_chars]
+    parts, length = [], 0
+    for p in article.find_all("p"):
+        part = " ".join(p.get_text(separator=" ", strip=True).split())
+        parts.append(part)
+        length += len(part) + 1
+        if length >= max_chars:
+            break
+    return " ".join(parts)[:max_chars]
+
 
+def extract_image_url(soup):
+    return _first_meta_content(soup, OG_IMAGE_SELECTORS)
 
-def extract_image_url_from_article(html):
+
+def parse_article(html, max_chars=500):
+    """Parse article HTML once and return (title, content, image_url)."""
     if not html:
-        return None
-    soup = BeautifulSoup(html, "html.parser")
-    meta = soup.select_one("meta[property='og:image']")
-    return meta.get("content", "").strip() if meta else None
-
-
-def analyze_word_frequency(headers):
-    freq = {}
-    for header in headers:
-        words = [
-            w.strip("',.-!?\"")
-            for w in (header or "").lower().split()
-            if w.strip("',.-!?\"") not in STOPWORDS
-        ]
-        for word in words:
-            freq[word] = freq.get(word, 0) + 1
+        return "", "", None
+    soup = BeautifulSoup(html, "lxml", parse_only=ARTICLE_STRAINER)
+    return extract_title(soup), extract_article_content(soup, max_chars), extract_image_url(soup)
+
+
+def needs_driver_render(html):
+    """True when a static fetch lacks <article> or is too small to be a real page."""
+    return not html or "<article" not in html.lower() or len(html) < 2000
+
+
+def process_article(url, idx, html):
+    """Parse one statically fetched article (never touches the driver)."""
+    article = {"url": url, "idx": idx, "html": html,
+               "title": "", "content_500": "", "image_url": None}
+    if needs_driver_render(html):
+        return article
+    article["title"], article["content_500"], article["image_url"] = parse_article(html)
+    return article
+
+
+def analyze_word_frequency(headers, _findall=WORD_RE.findall, _stopwords=STOPWORDS):
+    freq = Counter(
+        w
+        for header in headers if header
+        for w in _findall(header.lower())
+        if w not in _stopwords
+    )
     return {w: c for w, c in freq.items() if c > 2}
 
 
@@ -264,26 +580,42 @@ def run_test(driver=None, session_label="local", bs_config=None):
             except Exception:
                 pass
 
+    # Per-run jar: parallel sessions must not share or race on cookies.
+    cookie_jar = httpx.Cookies()
+    consent_checked = False
+
+    def _ensure_consent():
+        # Wait for the banner at most once per browser session, and not at
+        # all once the consent cookie exists; the resulting cookies then
+        # ride along on this run's static fetches.
+        nonlocal consent_checked
+        if consent_checked:
+            return
+        consent_checked = True
+        if not has_consent_cookie(driver):
+            accept_cookies(driver)
+        share_driver_cookies(driver, cookie_jar)
+
     try:
         driver.get("https://elpais.com/")
         WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        accept_cookies(driver)
+        _ensure_consent()
         logging.info(f"[{session_label}] Landed on: {driver.current_url}")
 
-        for _ in range(2):
-            try:
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
-            except Exception:
-                break
+        try:
+            scroll_page(driver)
+        except Exception:
+            pass
 
         # ── Collect article URLs ─────────────────────────────────────────────
-        article_urls = []
-        index_html = fetch_static_html(OPINION_URL)
-        if index_html:
-            soup = BeautifulSoup(index_html, "html.parser")
-            article_urls = extract_article_urls_from_soup(soup, max_urls=5)
-            logging.info(f"[{session_label}] Found via requests: {len(article_urls)}")
+        article_urls = fetch_article_urls_from_rss(max_urls=5)
+        logging.info(f"[{session_label}] Found via RSS: {len(article_urls)}")
+
+        if len(article_urls) < 5:
+            index_html = fetch_static_html(OPINION_URL, cookies=cookie_jar)
+            if index_html:
+                article_urls = extract_article_urls_from_html(index_html, max_urls=5)
+                logging.info(f"[{session_label}] Found via requests: {len(article_urls)}")
 
         if len(article_urls) < 5:
             logging.info(f"[{session_label}] Falling back to driver rendering…")
@@ -291,16 +623,12 @@ def run_test(driver=None, session_label="local", bs_config=None):
             WebDriverWait(driver, 12).until(
                 EC.presence_of_all_elements_located((By.TAG_NAME, "a"))
             )
-            accept_cookies(driver)
+            _ensure_consent()
             try:
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-                time.sleep(0.8)
+                scroll_page(driver)
             except Exception:
                 pass
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            article_urls = extract_article_urls_from_soup(soup, max_urls=5)
+            article_urls = extract_article_urls_from_html(driver.page_source, max_urls=5)
             logging.info(f"[{session_label}] Found via driver: {len(article_urls)}")
 
         if not article_urls:
@@ -309,56 +637,64 @@ def run_test(driver=None, session_label="local", bs_config=None):
             return
 
         # ── Extract content from each article ────────────────────────────────
+        logging.info(f"[{session_label}] Fetching {len(article_urls)} articles in parallel…")
+        article_htmls = asyncio.run(fetch_all(article_urls, stop_after_article=True, cookies=cookie_jar))
+        articles = [
+            process_article(url, idx, html)
+            for idx, (url, html) in enumerate(zip(article_urls, article_htmls), 1)
+        ]
+
         results = []
-        for idx, url in enumerate(article_urls, 1):
-            logging.info(f"[{session_label}] Processing article {idx}: {url}")
+        for article in articles:
+            idx, url = article["idx"], article["url"]
+            logging.info("[%s] Processing article %d: %s", session_label, idx, url)
 
-            article_html = fetch_static_html(url)
-            if not article_html or (
-                "<article" not in article_html.lower() and len(article_html) < 2000
-            ):
+            # The driver is not thread-safe, so render fallbacks run sequentially.
+            if needs_driver_render(article["html"]):
+                article_html = article["html"]
                 try:
                     driver.get(url)
                     WebDriverWait(driver, 12).until(
                         EC.presence_of_element_located((By.TAG_NAME, "article"))
                     )
-                    accept_cookies(driver)
+                    _ensure_consent()
                     article_html = driver.page_source
                 except TimeoutException:
                     logging.warning(
-                        f"[{session_label}] Timed out waiting for article {idx}; "
-                        "proceeding with best-effort content."
+                        "[%s] Timed out waiting for article %d; "
+                        "proceeding with best-effort content.", session_label, idx
                     )
+                article["title"], article["content_500"], article["image_url"] = (
+                    parse_article(article_html)
+                )
 
-            title       = extract_title_from_article_html(article_html)
-            content_500 = extract_article_content(article_html, max_chars=500)
-            image_url   = extract_image_url_from_article(article_html)
+            title       = article["title"]
+            content_500 = article["content_500"]
+            image_url   = article["image_url"]
 
             if image_url:
                 safe_label  = re.sub(r"[^a-zA-Z0-9_-]", "_", session_label)[:30]
                 image_fname = os.path.join(IMAGES_DIR, f"{safe_label}_article_{idx}.jpg")
                 download_image(image_url, image_fname)
 
-            logging.warning(f"[{session_label}] Title: {title or '[NO TITLE FOUND]'}")
+            logging.warning("[%s] Title: %s", session_label, title or "[NO TITLE FOUND]")
             logging.warning(
-                f"[{session_label}] Content (first 500 chars):\n"
-                f"{content_500 or '[NO CONTENT FOUND]'}"
+                "[%s] Content (first 500 chars):\n%s",
+                session_label, content_500 or "[NO CONTENT FOUND]"
             )
             results.append({"url": url, "title": title, "content_500": content_500})
 
         # ── Translate titles & word-frequency analysis ───────────────────────
         logging.info(f"[{session_label}] --- Translated Titles (English) ---")
-        translated_headers = []
-        for i, r in enumerate(results, 1):
-            translated = translate_text(r["title"]) if r["title"] else ""
-            translated_headers.append(translated)
-            logging.info(f"[{session_label}] {i}. {translated}")
+        translated_headers = translate_titles([r["title"] for r in results])
+        for i, translated in enumerate(translated_headers, 1):
+            logging.info("[%s] %d. %s", session_label, i, translated)
 
         logging.info(f"[{session_label}] --- Words repeated more than twice ---")
         word_freq = analyze_word_frequency(translated_headers)
         if word_freq:
             for word, count in word_freq.items():
-                logging.info(f"[{session_label}]   {word}: {count}")
+                logging.info("[%s]   %s: %d", session_label, word, count)
         else:
             logging.info(f"[{session_label}] No words repeated more than twice.")
 
@@ -391,16 +727,20 @@ def run_browserstack(capability):
     driver = None
     try:
         driver = BrowserFactory.create_browserstack(capability)
+        driver.set_page_load_timeout(BS_PAGE_LOAD_TIMEOUT)
         logging.info(f"[{session_name}] Running scrape...")
         run_test(driver=driver, session_label=session_name, bs_config=capability)
 
     except Exception as e:
         logging.error(f"[{session_name}] Failed: {e}")
         if driver:
-            driver.execute_script(
-                f'browserstack_executor: {{"action": "setSessionStatus", "arguments": '
-                f'{{"status": "failed", "reason": "{str(e)[:100]}"}}}}'
-            )
+            try:
+                driver.execute_script(
+                    f'browserstack_executor: {{"action": "setSessionStatus", "arguments": '
+                    f'{{"status": "failed", "reason": "{str(e)[:100]}"}}}}'
+                )
+            except Exception:
+                pass
     finally:
         if driver:
             try:
@@ -453,8 +793,17 @@ def run_parallel_browserstack():
         },
     ]
 
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        executor.map(run_browserstack, capabilities)
+    # No with-block: its exit would join hung sessions and defeat the timeout.
+    executor = ThreadPoolExecutor(max_workers=len(capabilities))
+    futures = {executor.submit(run_browserstack, cap): cap["name"] for cap in capabilities}
+    try:
+        for fut in as_completed(futures, timeout=BS_RUN_TIMEOUT):
+            logging.info(f"[{futures[fut]}] Session finished.")
+    except FuturesTimeout:
+        pending = [name for fut, name in futures.items() if not fut.done()]
+        logging.error(f"Timed out after {BS_RUN_TIMEOUT}s waiting for: {', '.join(pending)}")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 # main